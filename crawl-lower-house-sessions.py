@@ -2,10 +2,15 @@
 """Crawl sessions of Romanian Lower House."""
 import datetime
 import logging
-import json
+import os
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
 from argparse import ArgumentParser
 from argparse import ArgumentTypeError
 from pathlib import Path
+from framework.core.navigation import PageCache
+from framework.core.navigation import get_browser
 from framework.core.navigation import UrlBuilder
 from framework.core.crawling.utils import SessionUrlsCrawler
 from framework.core.crawling.summary import SessionSummaryCrawler
@@ -27,38 +32,50 @@ def get_parsed_sessions(transcripts_dir):
         The dates of the parsed sessions taken from file names.
     """
     session_dates = set()
-    transcripts_dir = Path(transcripts_dir)
-    for file_name in transcripts_dir.glob("*.json"):
-        idx = file_name.stem.rfind('-')
-        session_date = file_name.stem[:idx]
-        session_dates.add(session_date)
+    if not os.path.isdir(transcripts_dir):
+        return session_dates
+    # Scanning the directory entries avoids building a Path for each file.
+    with os.scandir(transcripts_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.json'):
+                continue
+            stem = entry.name[:-len('.json')]
+            idx = stem.rfind('-')
+            session_dates.add(stem[:idx])
     return session_dates
 
 
-def iter_session_URLs(args):
+def iter_session_URLs(args, executor):
     """Iterate over session URLs from the arguments.
 
     Parameters
     ----------
     args: argparse.Namespace, required
         The command-line arguments of the script.
+    executor: concurrent.futures.Executor, required
+        The executor used to load the calendars of the years in parallel.
 
     Returns
     -------
-    url_generator: generator of (datetime, str) tuples
+    url_generator: generator of (datetime.date, str) tuples
         The collection of session dates and their URLs.
     """
     if args.date:
-        url_builder = UrlBuilder()
-        yield args.date, url_builder.build_URL_for_session(args.date)
+        yield args.date, UrlBuilder.build_URL_for_session(args.date)
     else:
-        crawled_dates = set()
-        if not args.force:
+        if args.force:
+            crawled_dates = set()
+        else:
             crawled_dates = get_parsed_sessions(args.output_dir)
         crawler = SessionUrlsCrawler()
-        for year in args.years:
+        # Each calendar page is loaded only once even if a year is repeated.
+        years = sorted(set(args.years))
+        # The calendars are loaded in parallel but their session URLs are
+        # yielded in the order of the years.
+        futures = [executor.submit(crawler.crawl, year) for year in years]
+        for year, future in zip(years, futures):
             try:
-                for date, url in crawler.crawl(year):
+                for date, url in future.result():
                     date_str = date.strftime("%Y-%m-%d")
                     if date_str in crawled_dates:
                         message = "Date %s is already parsed; skipping."
@@ -92,49 +109,87 @@ def save_session_transcript(output_dir, transcript, session_date, session_id):
 
     file_name = output_dir / "{date}-{id}.json".format(
         date=session_date.strftime("%Y-%m-%d"), id=session_id)
-    with open(str(file_name), 'w', encoding='utf8') as f:
-        json.dump(transcript, f, indent=2, ensure_ascii=False)
+    # orjson encodes directly to UTF-8 bytes, so the file is written in binary mode.
+    with open(str(file_name), 'wb') as f:
+        f.write(orjson.dumps(transcript, option=orjson.OPT_INDENT_2))
+
+
+def crawl_session(date, url, output_dir):
+    """Crawl the transcripts of the sessions from the specified URL and save them.
+
+    Parameters
+    ----------
+    date: datetime.date, required
+        The date of the sessions.
+    url: str, required
+        The URL of the page containing the session summaries.
+    output_dir: str, required
+        The directory where to save session transcripts.
+    """
+    logging.info("Crawling session summary for date {} from {}.".format(
+        date.strftime("%Y-%m-%d"), url))
+    summaries = SessionSummaryCrawler().crawl(url)
+    for summary in summaries:
+        transcript = SessionTranscriptCrawler(date).crawl(
+            summary['full_transcript_url'])
+        summary.update(transcript)
+        session_id = summary['session_id']
+        save_session_transcript(output_dir, summary, date, session_id)
 
 
 def main(args):
     """Crawl session transcripts."""
+    if args.cache_dir is not None:
+        get_browser().page_cache = PageCache(args.cache_dir)
     if args.date:
         logging.info("Crawling session transcript for date {}.".format(
             args.date))
     else:
         logging.info("Crawling sessions for the following years: {}.".format(
             ", ".join([str(year) for year in args.years])))
-    for date, url in iter_session_URLs(args):
-        logging.info("Crawling session summary for date {} from {}.".format(
-            date.strftime("%Y-%m-%d"), url))
+    # Sessions are independent of each other and crawling them is bound by
+    # page loads, so they are crawled by a bounded number of threads. The same
+    # threads load the calendars, so no additional web browsers are started.
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
         try:
-            summaries = SessionSummaryCrawler().crawl(url)
-            for summary in summaries:
-                transcript = SessionTranscriptCrawler(date).crawl(
-                    summary['full_transcript_url'])
-                summary.update(transcript)
-                session_id = summary['session_id']
-                save_session_transcript(args.output_dir, summary, date,
-                                        session_id)
-        except Exception as e:
-            logging.error("Could not crawl session contents from URL %s.",
-                          url,
-                          exc_info=e)
+            futures = {
+                executor.submit(crawl_session, date, url, args.output_dir):
+                url
+                for date, url in iter_session_URLs(args, executor)
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logging.error(
+                        "Could not crawl session contents from URL %s.",
+                        futures[future],
+                        exc_info=e)
+        except BaseException:
+            # Drop the queued sessions so that an interrupted run stops after
+            # the sessions that are already being crawled.
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
 
 
 def valid_year(year):
-    """Return True if provided year is valid as an argument to the script.
+    """Validate the year provided as an argument to the script.
 
     Parameters
     ----------
     year: str, required
         The year to validate.
+
+    Returns
+    -------
+    year: int
+        The year as an integer if it is valid.
     """
     year = int(year)
-    max_year = datetime.date.year
-    if year <= 2000 or year > max_year:
+    max_year = datetime.date.today().year
+    if year < 2000 or year > max_year:
         raise ArgumentTypeError(
-            "Year must be betweer 2000 and {} inclusive.".format(max_year))
+            "Year must be between 2000 and {} inclusive.".format(max_year))
     return year
 
 
@@ -150,9 +205,7 @@ def parse_arguments():
     group.add_argument('--year',
                        help="List of years for which to crawl transcripts.",
                        dest='years',
-                       type=int,
-                       choices=range(2000,
-                                     datetime.date.today().year + 1),
+                       type=valid_year,
                        nargs='+')
     parser.add_argument('--force',
                         help="""
@@ -164,6 +217,17 @@ def parse_arguments():
                         help="The path of the output directory.",
                         type=str,
                         default='data/sessions/')
+    parser.add_argument('--cache-dir',
+                        help="""
+                        The directory where to cache the loaded pages.
+                        If not provided the pages are always downloaded.
+                        """,
+                        type=str,
+                        default=None)
+    parser.add_argument('--workers',
+                        help="The number of sessions to crawl in parallel.",
+                        type=int,
+                        default=4)
     parser.add_argument(
         '-l',
         '--log-level',
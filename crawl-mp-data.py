@@ -1,13 +1,17 @@
 #!/usr/bin/env python
 """Crawl deputy data."""
 import argparse
+import csv
 import logging
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
 from pathlib import Path
+from framework.core.navigation import PageCache
+from framework.core.navigation import get_browser
 from framework.utils.loggingutils import configure_logging
 from framework.utils.sessionutils import load_speakers
 from framework.core.crawling.memberprofile import MemberProfileCrawler
-from framework.utils.dataframeutils import save_data_frame
 
 
 def load_processed_urls(profile_data_file: str) -> set:
@@ -24,11 +28,61 @@ def load_processed_urls(profile_data_file: str) -> set:
         The set of processed profile URLs.
     """
     profiles_file = Path(profile_data_file)
-    if not profiles_file.exists():
+    # The file can be left empty if a run is killed before writing any row.
+    if not profiles_file.exists() or profiles_file.stat().st_size == 0:
         return set()
 
-    df = pd.read_csv(profile_data_file)
-    return set(df.profile_url)
+    # Only the URLs are needed so the other columns are not parsed at all.
+    df = pd.read_csv(profile_data_file,
+                     usecols=['profile_url'],
+                     dtype={'profile_url': 'string'},
+                     na_filter=False)
+    return {normalize_profile_url(url) for url in df.profile_url}
+
+
+def load_field_names(profile_data_file: str) -> list:
+    """Load the names of the columns from the profile data file.
+
+    Parameters
+    ----------
+    profile_data_file: str, required
+        The path to the CSV file containing already scrapped profile data.
+
+    Returns
+    -------
+    field_names: list of str
+        The column names from the header of the file if it already has data;
+        otherwise the default column names of the profile data.
+    """
+    # The first column is the unnamed row index that pandas used to write,
+    # so the layout is the same for new files and for the existing ones.
+    profiles_file = Path(profile_data_file)
+    if profiles_file.exists() and profiles_file.stat().st_size > 0:
+        with open(profile_data_file, 'r', newline='', encoding='utf8') as f:
+            return next(csv.reader(f))
+    return [
+        '', 'profile_image', 'full_name', 'first_name', 'last_name',
+        'profile_url', 'sex'
+    ]
+
+
+def normalize_profile_url(profile_url: str) -> str:
+    """Bring the profile URL to its canonical form.
+
+    Some of the profile URLs from the session transcripts end with a dot or
+    whitespace; they are removed so that the same profile has a single URL.
+
+    Parameters
+    ----------
+    profile_url: str, required
+        The profile URL to normalize.
+
+    Returns
+    -------
+    profile_url: str
+        The canonical form of the profile URL.
+    """
+    return profile_url.strip().rstrip('.')
 
 
 def load_profile_data(sessions_dir: str, exclude_urls: set = None) -> dict:
@@ -39,29 +93,48 @@ def load_profile_data(sessions_dir: str, exclude_urls: set = None) -> dict:
     sessions_dir: str, required
         The path of the directory containing session transcriptions.
     exclude_urls: set of str, optional
-        The URLs to exclude.
+        The URLs to exclude, in their canonical form.
 
     Returns
     -------
     profile_data: dict
-        A dictionary containing profile URLs as keys and MP sex as values.
+        A dictionary containing canonical profile URLs as keys and MP sex as values.
     """
     logging.info("Searching profile URLs in session transcripts from %s.",
                  sessions_dir)
     if exclude_urls is None:
         exclude_urls = set()
     profile_data = {}
-    for s in load_speakers(args.sessions_dir):
-        profile_url = s['profile_url']
-        if profile_url is None:
+    # Keep the sex from the first occurrence of each URL.
+    for s in load_speakers(sessions_dir):
+        profile_url = s.get('profile_url')
+        if not profile_url:
             continue
-        profile_url = profile_url.rstrip('.')
+        profile_url = normalize_profile_url(profile_url)
         if profile_url not in exclude_urls:
-            profile_data[profile_url] = s['sex']
-            exclude_urls.add(profile_url)
+            profile_data.setdefault(profile_url, s['sex'])
     return profile_data
 
 
+def crawl_profile(crawler: MemberProfileCrawler, profile_url: str) -> dict:
+    """Crawl the profile info of an MP.
+
+    Parameters
+    ----------
+    crawler: MemberProfileCrawler, required
+        The crawler used to crawl the profile.
+    profile_url: str, required
+        The URL of the MP profile.
+
+    Returns
+    -------
+    profile_info: dict
+        The dict containing profile info.
+    """
+    logging.debug("Crawling profile info for URL %s.", profile_url)
+    return crawler.crawl(profile_url)
+
+
 def main(args):
     """Crawl deputy data from session transcriptions.
 
@@ -70,26 +143,73 @@ def main(args):
     args: argparse.Namespace, required
         The command-line arguments of the script.
     """
+    if args.cache_dir is not None:
+        get_browser().page_cache = PageCache(args.cache_dir)
     exclude_urls = load_processed_urls(args.profile_info_file)
     data = load_profile_data(args.sessions_dir, exclude_urls=exclude_urls)
+    if not data:
+        logging.info("No new profile URLs found (%d already processed).",
+                     len(exclude_urls))
+        return
     logging.info("Start crawling profile info.")
-    records = []
     crawler = MemberProfileCrawler()
-    for profile_url, sex in data.items():
-        try:
-            logging.info("Crawling profile info for URL %s.", profile_url)
-            profile_info = crawler.crawl(profile_url)
-            profile_info.update({'profile_url': profile_url, 'sex': sex})
-            records.append(profile_info)
-        except Exception as e:
-            logging.error("Could not crawl session contents from URL %s.",
-                          profile_url,
-                          exc_info=e)
-
+    output_file = Path(args.profile_info_file)
+    if not output_file.parent.exists():
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+    # Keep the columns of an existing file so that the new rows line up.
+    field_names = load_field_names(args.profile_info_file)
     logging.info("Saving profile data to %s.", args.profile_info_file)
-    save_data_frame(pd.DataFrame.from_records(records),
-                    args.profile_info_file,
-                    append=True)
+    # Each profile is written as soon as it is crawled so that the progress
+    # is not lost if the crawling is interrupted.
+    with open(args.profile_info_file, 'a', newline='', encoding='utf8') as f:
+        writer = csv.DictWriter(f,
+                                fieldnames=field_names,
+                                quoting=csv.QUOTE_NONNUMERIC,
+                                lineterminator='\n')
+        if f.tell() == 0:
+            writer.writeheader()
+            f.flush()
+        # The workers only crawl the profiles; the rows are written from this
+        # thread as the futures complete, so the writer is never shared.
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            try:
+                futures = {}
+                row_index = 0
+                for profile_url, sex in data.items():
+                    future = executor.submit(crawl_profile, crawler,
+                                             profile_url)
+                    futures[future] = (profile_url, sex)
+                for count, future in enumerate(as_completed(futures),
+                                               start=1):
+                    # Report the progress periodically instead of for each
+                    # URL.
+                    if count % 50 == 0 or count == len(futures):
+                        logging.info("Crawled %d of %d profiles.", count,
+                                     len(futures))
+                    profile_url, sex = futures[future]
+                    try:
+                        profile_info = future.result()
+                        # Like the pandas index, the row index starts from 0
+                        # on each run.
+                        profile_info.update({
+                            '': row_index,
+                            'profile_url': profile_url,
+                            'sex': sex
+                        })
+                        writer.writerow(profile_info)
+                        f.flush()
+                        row_index += 1
+                    except Exception as e:
+                        logging.error(
+                            "Could not crawl session contents from URL %s.",
+                            profile_url,
+                            exc_info=e)
+            except BaseException:
+                # Drop the queued profiles; their rows could not be written
+                # anymore once the loop above is left.
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
     logging.info("That's all folks!")
 
 
@@ -106,6 +226,17 @@ def parse_arguments():
                         help="The path of the CSV file where to save data.",
                         type=str,
                         default="./data/speakers/profile-info.csv")
+    parser.add_argument('--cache-dir',
+                        help="""
+                        The directory where to cache the loaded pages.
+                        If not provided the pages are always downloaded.
+                        """,
+                        type=str,
+                        default=None)
+    parser.add_argument('--workers',
+                        help="The number of profiles to crawl in parallel.",
+                        type=int,
+                        default=4)
     parser.add_argument(
         '-l',
         '--log-level',
@@ -1,5 +1,5 @@
 """Module responsible for crawling MP profile."""
-from framework.core.navigation import Browser
+from framework.core.navigation import get_browser
 from framework.core.navigation import UrlBuilder
 from framework.core.parsing.memberprofile import MemberProfileInfoParser
 
@@ -9,9 +9,8 @@ class MemberProfileCrawler:
 
     def __init__(self):
         """Create a new instance of the MP profile crawler class."""
-        self.__browser = Browser()
+        self.__browser = get_browser()
         self.__parser = MemberProfileInfoParser()
-        self.__url_builder = UrlBuilder()
 
     def crawl(self, profile_url: str) -> dict:
         """Crawl the MP profile info.
@@ -30,6 +29,6 @@ class MemberProfileCrawler:
         profile_info = self.__parser.parse_profile_info(html)
         profile_image = profile_info['profile_image']
         if profile_image is not None:
-            profile_info['profile_image'] = self.__url_builder.build_full_URL(
+            profile_info['profile_image'] = UrlBuilder.build_full_URL(
                 profile_image)
         return profile_info
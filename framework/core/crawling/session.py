@@ -2,8 +2,8 @@
 import logging
 import re
 import datetime
-from framework.core.navigation import UrlBuilder
-from framework.core.navigation import Browser
+from lxml import etree
+from framework.core.navigation import get_browser
 from framework.core.crawling.utils import get_element_text
 from framework.core.crawling.speakerinfo import SpeakerInfoParser
 
@@ -11,6 +11,9 @@ from framework.core.crawling.speakerinfo import SpeakerInfoParser
 class SessionTranscriptCrawler:
     """Crawl session transcript."""
 
+    TranscriptTableXPath = etree.XPath("(//div[@id='olddiv']/table)[1]")
+    TranscriptContentsXPath = etree.XPath(".//td[contains(@width, '100')]")
+
     def __init__(self, session_date):
         """Create a new instance of session transcript crawler.
 
@@ -19,8 +22,7 @@ class SessionTranscriptCrawler:
         session_date: datetime.date, required
             The date of the session.
         """
-        self.__url_builder = UrlBuilder()
-        self.__browser = Browser()
+        self.__browser = get_browser()
         self.__start_end_parser = SessionStartEndParser(session_date)
         self.__contents_parser = SessionContentParser()
 
@@ -66,12 +68,8 @@ class SessionTranscriptCrawler:
         contents: list of etree.Element
             The contents of session transcript.
         """
-        contents = []
-        for td in transcript_table.iterdescendants(tag='td'):
-            width = td.get('width')
-            if width is not None and "100" in width:
-                contents.append(td)
-        return contents
+        return SessionTranscriptCrawler.TranscriptContentsXPath(
+            transcript_table)
 
     def __get_transcript_table(self, session_url):
         """Load the transcript page and returns the table containing session segments.
@@ -87,7 +85,7 @@ class SessionTranscriptCrawler:
             The table element containing session segments.
         """
         html_root = self.__browser.load_page(session_url)
-        tables = html_root.xpath("//div[@id='olddiv']/table")
+        tables = SessionTranscriptCrawler.TranscriptTableXPath(html_root)
         if len(tables) == 0:
             logging.error(
                 "Could not locate transcript table for URL {}.".format(
@@ -99,6 +97,17 @@ class SessionTranscriptCrawler:
 class SessionStartEndParser:
     """Parse the start and end sections of a session transcript."""
 
+    # Some session transcripts use period as hour and time separator,
+    # others use comma. The regex below tries to match any of them in an
+    # unnamed group. The digits on the left are captured as hour and
+    # time into two separate capturing groups.
+    TimeRegex = re.compile(r"(?P<hour>\d{1,2})(\.|,)(?P<minute>\d{2})\.$",
+                           re.MULTILINE)
+    # The start section needs only the first two paragraphs (start mark and
+    # chairmen) and the end section only the last one.
+    StartParagraphsXPath = etree.XPath("(.//p)[position() <= 2]")
+    EndParagraphXPath = etree.XPath("(.//p)[last()]")
+
     def __init__(self, session_date):
         """Create a new instance of the class.
 
@@ -127,7 +136,7 @@ class SessionStartEndParser:
         section: dict,
             The contents of start section.
         """
-        para = [p for p in element.iterdescendants(tag='p')]
+        para = SessionStartEndParser.StartParagraphsXPath(element)
         if len(para) == 0:
             logging.error(
                 "Cannot parse session start info for session from {}.".format(
@@ -162,7 +171,7 @@ class SessionStartEndParser:
                     self.session_date))
             return None
         # Get the last <p> element from the node given as parameter
-        end_section = [p for p in element.iterdescendants(tag='p')][-1]
+        end_section = SessionStartEndParser.EndParagraphXPath(element)[0]
         end_mark = get_element_text(end_section)
         end_time = self.__parse_time(end_mark)
         return {'end_mark': end_mark, 'end_time': end_time}
@@ -180,12 +189,7 @@ class SessionStartEndParser:
         time: datetime
             The date and time when session started; None if parsing failed.
         """
-        # Some session transcripts use period as hour and time separator,
-        # others use comma. The regex below tries to match any of them in an
-        # unnamed group. The digits on the left are captured as hour and
-        # time into two separate capturing groups.
-        pattern = r"(?P<hour>\d{1,2})(\.|,)(?P<minute>\d{2})\.$"
-        match = re.search(pattern, line, re.MULTILINE)
+        match = SessionStartEndParser.TimeRegex.search(line)
         if not match:
             logging.error(
                 "Could not parse time from line '{}' for session date {}.".
@@ -221,6 +225,10 @@ class SessionStartEndParser:
 class SessionContentParser:
     """Parse the contents of session segments."""
 
+    # We consider an annotation only the text in parentheses
+    AnnotationRegex = re.compile(r"\([^)]+\)")
+    ContentElementsXPath = etree.XPath(".//*[self::p or self::li]")
+
     def __init__(self):
         """Create a new instance of the class."""
         self.__speaker_parser = SpeakerInfoParser()
@@ -258,9 +266,7 @@ class SessionContentParser:
         contents: dict
             The contents of the section.
         """
-        content_elements = [
-            e for e in section.iterdescendants() if e.tag in ['p', 'li']
-        ]
+        content_elements = SessionContentParser.ContentElementsXPath(section)
         speaker = self.__speaker_parser.parse(content_elements[0])
         contents = []
         for c in content_elements[1:]:
@@ -294,7 +300,8 @@ class SessionContentParser:
         annotations_text = [
             i.text_content() for i in element.iterdescendants(tag='i')
         ]
-        # We consider an annotation only the text in parentheses
-        pattern = r"\([^)]+\)"
-        annotations = [a for a in annotations_text if re.match(pattern, a)]
+        annotations = [
+            a for a in annotations_text
+            if SessionContentParser.AnnotationRegex.match(a)
+        ]
         return {'text': text, 'annotations': annotations}
@@ -1,15 +1,17 @@
 """Module responsible for crawling speaker info."""
 import re
+from lxml.cssselect import CSSSelector
 from framework.core.navigation import UrlBuilder
-from framework.core.navigation import Browser
+from framework.core.navigation import get_browser
 
 
 class SpeakerInfoParser:
     """Parse the speaker information."""
 
-    def __init__(self):
-        """Create a new instance of the class."""
-        self.__ulr_builder = UrlBuilder()
+    # Matches the prefix of the name, and the text in parentheses that
+    # precedes the colon after the name.
+    NamePrefixRegex = re.compile(r'domnul|doamna|(\(.+)?:',
+                                 re.MULTILINE | re.IGNORECASE)
 
     def parse(self, element):
         """Parse speaker info from the provided element.
@@ -24,8 +26,9 @@ class SpeakerInfoParser:
         speaker: dict
             The parsed speaker information.
         """
-        name_element = self.__get_name_element(element)
+        name_element, anchor, comment = self.__get_speaker_elements(element)
         if name_element is None:
+            # The element doesn't contain the name of a speaker
             return None
 
         name_with_prefix = name_element.text_content()
@@ -33,32 +36,44 @@ class SpeakerInfoParser:
         speaker = {
             'text': element.text_content().strip(),
             'full_name': self.__parse_full_name(name_with_prefix),
-            'profile_url': self.__parse_profile_url(element),
+            'profile_url': self.__parse_profile_url(anchor),
             'sex': self.__parse_speaker_sex(name_with_prefix),
-            'annotation': self.__parse_annotation(element)
+            'annotation': self.__parse_annotation(comment)
         }
 
         return speaker
 
-    def __get_name_element(self, element):
-        """Get the name element from the provided element, if present.
+    def __get_speaker_elements(self, element):
+        """Find the elements holding speaker info in a single pass.
+
+        The descendants are filtered by tag inside lxml and the iteration
+        stops as soon as the first element of each kind was found.
 
         Parameters
         ----------
         element: etree.Element, required
-            The parent element from which to extract name element.
+            The parent element from which to extract speaker info elements.
 
         Returns
         -------
-        name_element: etree.Element
-            The name element if present; None otherwise.
+        (name_element, anchor, comment): tuple of etree.Element
+            The first name element, profile link, and annotation element;
+            each of them is None if not present.
         """
-        fonts = [f for f in element.iterdescendants(tag='font')]
-        if len(fonts) == 0:
-            # The element doesn't contain the name of a speaker
-            return None
-
-        return fonts[0]
+        name_element, anchor, comment = None, None, None
+        for e in element.iterdescendants('font', 'a', 'i'):
+            if e.tag == 'font':
+                if name_element is None:
+                    name_element = e
+            elif e.tag == 'a':
+                if anchor is None and e.get('target') == "PARLAMENTARI":
+                    anchor = e
+            elif comment is None:
+                comment = e
+            if all(found is not None
+                   for found in (name_element, anchor, comment)):
+                break
+        return name_element, anchor, comment
 
     def __parse_speaker_sex(self, name_with_prefix):
         """Parse speaker sex from the text containing name and prefix.
@@ -73,7 +88,8 @@ class SpeakerInfoParser:
         sex: str
             The sex of the speaker; 'M' if male, 'F' if female.
         """
-        return 'M' if name_with_prefix.lower().startswith("domnul") else 'F'
+        # Only the prefix needs to be lowercased, not the whole name.
+        return 'M' if name_with_prefix[:6].lower() == "domnul" else 'F'
 
     def __parse_full_name(self, name_with_prefix):
         """Parse the full name of the speaker from the name with prefix.
@@ -90,17 +106,16 @@ class SpeakerInfoParser:
         """
         # TODO: Sometimes the name with prefix is mistyped as 'domnule first name last name',
         #       which is not handled by the regex below.
-        full_name = re.sub(r'domnul|doamna|(\(.+\)*)?:', '', name_with_prefix,
-                           0, re.MULTILINE | re.IGNORECASE)
+        full_name = SpeakerInfoParser.NamePrefixRegex.sub('', name_with_prefix)
         return full_name.strip()
 
-    def __parse_profile_url(self, element):
+    def __parse_profile_url(self, anchor):
         """Parse the profile URL of the speaker if present.
 
         Parameters
         ----------
-        element: etree.Element, required
-             The element containing speaker information.
+        anchor: etree.Element, required
+             The link to the profile page of the speaker, or None.
 
         Returns
         -------
@@ -108,24 +123,19 @@ class SpeakerInfoParser:
             The full URL of the speaker profile if present; otherwise None.
         """
         profile_url = None
-        anchors = [
-            a for a in element.iterdescendants(tag='a')
-            if a.get('target') == "PARLAMENTARI"
-        ]
-
-        if len(anchors) > 0:
-            profile_url = anchors[0].get('href')
-            profile_url = self.__ulr_builder.build_full_URL(profile_url)
+        if anchor is not None:
+            profile_url = anchor.get('href')
+            profile_url = UrlBuilder.build_full_URL(profile_url)
 
         return profile_url
 
-    def __parse_annotation(self, element):
+    def __parse_annotation(self, comment):
         """Parse the annotation from speaker info element if present.
 
         Parameters
         ----------
-        element: etree.Element, required
-             The element containing speaker information.
+        comment: etree.Element, required
+             The first italic element from the speaker info element, or None.
 
         Returns
         -------
@@ -133,18 +143,20 @@ class SpeakerInfoParser:
             The annotation beside the speaker name if present; otherwise None.
         """
         annotation = None
-        comments = [i for i in element.iterdescendants(tag='i')]
-        if len(comments) > 0:
-            annotation = comments[0].text_content()
+        if comment is not None:
+            annotation = comment.text_content()
         return annotation
 
 
 class SpeakerProfileCrawler:
     """Crawl speaker profile page."""
 
+    NameSelector = CSSSelector('div.boxTitle h1', translator='html')
+    MemberTypeSelector = CSSSelector('div.boxDep h3', translator='html')
+
     def __init__(self):
         """Create a new instance of the class."""
-        self.__browser = Browser()
+        self.__browser = get_browser()
 
     def crawl(self, profile_url):
         """Crawl speaker profile data from provided URL.
@@ -183,7 +195,7 @@ class SpeakerProfileCrawler:
         (first_name, last_name): tuple of (list of str, list of str)
             The first and last names of the speaker split into constituent parts by space.
         """
-        name_elements = list(html_root.cssselect('div.boxTitle h1'))
+        name_elements = SpeakerProfileCrawler.NameSelector(html_root)
         if len(name_elements) == 0:
             return (None, None)
         name = name_elements[0].text_content()
@@ -208,7 +220,7 @@ class SpeakerProfileCrawler:
         mp_type: str
             The type of member of parliament; can be either 'Senator' or 'Deputy'.
         """
-        profile_sections = list(html_root.cssselect('div.boxDep h3'))
+        profile_sections = SpeakerProfileCrawler.MemberTypeSelector(html_root)
         member_type = profile_sections[0]
         member_type_text = member_type.text_content()
         if 'deputat' in member_type_text.lower():
@@ -2,8 +2,10 @@
 import logging
 from urllib.parse import urlparse as parse_url
 from urllib.parse import parse_qs
+from lxml import etree
+from lxml.cssselect import CSSSelector
 from framework.core.navigation import UrlBuilder
-from framework.core.navigation import Browser
+from framework.core.navigation import get_browser
 
 
 class SessionSummaryCrawler:
@@ -13,8 +15,7 @@ class SessionSummaryCrawler:
 
     def __init__(self):
         """Create a new instance of session summary crawler."""
-        self.__url_builder = UrlBuilder()
-        self.__browser = Browser()
+        self.__browser = get_browser()
         self.__summary_parser = SessionSummaryParser()
         self.__summary_urls_parser = SummaryUrlsParser()
 
@@ -28,24 +29,24 @@ class SessionSummaryCrawler:
 
         Returns
         -------
-        summaries: list of dict
-            The summaries of the sessions from the URL
+        summaries: generator of dict
+            The summaries of the sessions from the URL. The summaries are
+            crawled one at a time, as they are consumed, so that the caller
+            does not need to hold all of them in memory.
         """
         html_root = self.__browser.load_page(session_url)
         if self.__is_single_session_summary(html_root):
             logging.info(
                 "The URL {} contains the summary of a single session.".format(
                     session_url))
-            return [self.__summary_parser.parse(html_root)]
+            yield self.__summary_parser.parse(html_root)
         else:
             logging.info(
                 "The URL {} contains the summary of multiple sessions.".format(
                     session_url))
-            summaries = []
             for summary_url in self.__summary_urls_parser.parse(html_root):
-                html_root = self.__browser.load_page(summary_url)
-                summaries.append(self.__summary_parser.parse(html_root))
-        return summaries
+                yield self.__summary_parser.parse(
+                    self.__browser.load_page(summary_url))
 
     def __is_single_session_summary(self, html_root):
         """Determine whether the provided HTML tree contains the summary of a single session or multiple sessions.
@@ -66,9 +67,9 @@ class SessionSummaryCrawler:
 class SummaryUrlsParser:
     """Parse the summary URLs from page."""
 
-    def __init__(self):
-        """Create a new instance of the class."""
-        self.__url_builder = UrlBuilder()
+    TitleBoxSelector = CSSSelector("div.boxTitle", translator='html')
+    SummaryAnchorSelector = CSSSelector("div.resurse-list a[href*='sumar']",
+                                        translator='html')
 
     def parse(self, html_root):
         """Parse the summary URLs when there are multiple summaries on the page.
@@ -84,14 +85,14 @@ class SummaryUrlsParser:
             The URLs of session summaries.
         """
         summary_urls = set()
-        for title_box in html_root.cssselect("div.boxTitle"):
+        for title_box in SummaryUrlsParser.TitleBoxSelector(html_root):
             full_url = self.__get_full_url(title_box.getparent())
             if full_url is None:
                 continue
 
             summary_urls.add(full_url)
 
-        for anchor in html_root.cssselect("div.resurse-list a[href*='sumar']"):
+        for anchor in SummaryUrlsParser.SummaryAnchorSelector(html_root):
             summary_urls.add(self.__get_full_url(anchor))
         return list(summary_urls)
 
@@ -114,16 +115,23 @@ class SummaryUrlsParser:
                 "Could not find the link for session summary for {}.".format(
                     anchor.text_content()))
             return None
-        full_url = self.__url_builder.build_full_URL(path_and_query)
+        full_url = UrlBuilder.build_full_URL(path_and_query)
         return full_url
 
 
 class SessionSummaryParser:
     """Parse the session summary."""
 
+    # Selects, in a single query, the session title (the last heading of the
+    # title boxes), the summary table, and the link to the full transcript
+    # (the second anchor from the last div with the class 'resurse-list').
+    SummaryElementsXPath = etree.XPath(
+        "(//div[@class='box-title']/h3)[last()]"
+        " | (//div[@id='olddiv']/table)[1]"
+        " | (//div[@class='resurse-list'])[last()]/descendant::a[2]")
+
     def __init__(self):
         """Create a new instance of the class."""
-        self.__url_builder = UrlBuilder()
         self.__summary_urls_parser = SummaryUrlsParser()
 
     def parse(self, html_root):
@@ -139,48 +147,71 @@ class SessionSummaryParser:
         summary: dict
             The summary of the session.
         """
-        summary_rows = self.__parse_summary_rows(html_root)
-        transcript_url = self.__parse_full_transcript_url(html_root)
+        title, summary_table, transcript_link = self.__get_summary_elements(
+            html_root)
+        summary_rows = self.__parse_summary_rows(summary_table)
+        transcript_url = self.__parse_full_transcript_url(transcript_link)
         return {
             'session_id': self.__parse_session_id(html_root),
-            'session_title': self.__parse_session_title(html_root),
+            'session_title': self.__parse_session_title(title),
             'full_transcript_url': transcript_url,
             'summary': summary_rows
         }
 
-    def __parse_session_title(self, html_root):
-        """Parse session title from HTML markup.
+    def __get_summary_elements(self, html_root):
+        """Get the elements containing the parts of the summary.
 
         Parameters
         ----------
         html_root: etree.Element, required
             The HTML tree.
 
+        Returns
+        -------
+        (title, summary_table, transcript_link): tuple of etree.Element
+            The session title heading, the summary table, and the link to the
+            full transcript; each of them is None if not found.
+        """
+        title, summary_table, transcript_link = None, None, None
+        for element in SessionSummaryParser.SummaryElementsXPath(html_root):
+            if element.tag == 'h3':
+                title = element
+            elif element.tag == 'table':
+                summary_table = element
+            else:
+                transcript_link = element
+        return title, summary_table, transcript_link
+
+    def __parse_session_title(self, title):
+        """Parse session title from HTML markup.
+
+        Parameters
+        ----------
+        title: etree.Element, required
+            The heading containing the session title.
+
         Returns
         -------
         title: str
             The title of the session if found; otherwise None.
         """
-        headings = [
-            title for title in html_root.xpath("//div[@class='box-title']/h3")
-        ]
-        session_title = headings[-1]
-        return session_title.text_content()
+        if title is None:
+            return None
+        return title.text_content()
 
-    def __parse_summary_rows(self, html_root):
+    def __parse_summary_rows(self, summary_table):
         """Parse summary rows from page.
 
         Parameters
         ----------
-        html_root: etree.Element, required
-            The HTML tree.
+        summary_table: etree.Element, required
+            The table containing the summary of the session.
 
         Returns
         -------
         summary_rows: iterable of dict
             The summary rows of the session.
         """
-        summary_table = html_root.xpath("//div[@id='olddiv']/table")[0]
         summary_rows = []
         for tr in summary_table.iterdescendants(tag="tr"):
             number, url, contents, is_subrow = self.__parse_summary_row(tr)
@@ -190,7 +221,7 @@ class SessionSummaryParser:
             else:
                 row = {
                     'number': number,
-                    'url': self.__url_builder.build_full_URL(url),
+                    'url': UrlBuilder.build_full_URL(url),
                     'contents': contents
                 }
                 summary_rows.append(row)
@@ -224,25 +255,21 @@ class SessionSummaryParser:
 
         return (number, url, contents, is_subrow)
 
-    def __parse_full_transcript_url(self, html_root):
+    def __parse_full_transcript_url(self, transcript_link):
         """Parse the URL of the full session transcript.
 
         Parameters
         ----------
-        html_root: etree.Element, required
-            The HTML tree.
+        transcript_link: etree.Element, required
+            The anchor linking to the full session transcript.
 
         Returns
         -------
         url: str
             The URL of the full session transcript.
         """
-        # Take the last div with the class 'resurse-list'
-        resources_div = html_root.xpath("//div[@class='resurse-list']")[-1]
-        # From the div return the href of the second anchor
-        links = [a for a in resources_div.iterdescendants(tag="a")]
-        path_and_query = links[1].get('href')
-        return self.__url_builder.build_full_URL(path_and_query)
+        path_and_query = transcript_link.get('href')
+        return UrlBuilder.build_full_URL(path_and_query)
 
     def __parse_session_id(self, html_root):
         """Parse the id of the session from summary page.
@@ -271,6 +298,12 @@ class SessionSummaryParser:
 class SummaryRowContentsParser:
     """Parse the contents of a session summary row."""
 
+    # Selects the text nodes which are not made only of whitespace; nodes
+    # containing only non-breaking spaces are still filtered after strip().
+    TextNodesXPath = etree.XPath(".//text()[normalize-space()]")
+    ColumnCountXPath = etree.XPath("count(.//td)")
+    SecondColumnXPath = etree.XPath("(.//td)[2]")
+
     def __init__(self, row):
         """Create a new instance of the class.
 
@@ -279,12 +312,15 @@ class SummaryRowContentsParser:
         row: etree.Element, required
             The summary row to parse.
         """
-        columns = [td for td in row.iterdescendants(tag='td')]
         # If the number of columns is 3 then the current row is a subrow.
         # In such case, we take the whole text of the row as the contents;
         # otherwise, the contents are taken from the second column of the row.
-        self.__is_subrow = len(columns) == 3
-        self.__contents_source = row if self.__is_subrow else columns[1]
+        self.__is_subrow = SummaryRowContentsParser.ColumnCountXPath(row) == 3
+        if self.__is_subrow:
+            self.__contents_source = row
+        else:
+            self.__contents_source = SummaryRowContentsParser.SecondColumnXPath(
+                row)[0]
 
     @property
     def is_subrow(self):
@@ -368,12 +404,7 @@ class SummaryRowContentsParser:
         contents: str
             The contents of the subrow.
         """
-        contents = []
-        for raw_text in self.__contents_source.itertext():
-            text = raw_text.strip()
-            if text is not None and len(text) > 0:
-                contents.append(text)
-        return [' '.join(contents)]
+        return [' '.join(self.__get_text_lines())]
 
     def __parse_content_with_annotation(self):
         """Parse the contents of a row with an annotation.
@@ -396,11 +427,7 @@ class SummaryRowContentsParser:
         content_lines: list of str
             The content lines of the row.
         """
-        content_lines = [
-            t.strip() for t in self.__contents_source.itertext()
-            if len(t.strip()) > 0
-        ]
-        return content_lines
+        return self.__get_text_lines()
 
     def __parse_contents(self):
         """Parse the contents of a summary row.
@@ -411,3 +438,18 @@ class SummaryRowContentsParser:
             The contents of the row.
         """
         return self.__contents_source.text.strip()
+
+    def __get_text_lines(self):
+        """Get the non-empty text nodes of the contents source.
+
+        Returns
+        -------
+        text_lines: list of str
+            The stripped text of the nodes which are not empty.
+        """
+        text_lines = [
+            t.strip()
+            for t in SummaryRowContentsParser.TextNodesXPath(
+                self.__contents_source)
+        ]
+        return [t for t in text_lines if len(t) > 0]
@@ -1,8 +1,9 @@
 """Modules responsible for data crawling."""
 import datetime
-import re
+import logging
+from lxml import etree
 from framework.core.navigation import UrlBuilder
-from framework.core.navigation import Browser
+from framework.core.navigation import get_browser
 
 
 def get_element_text(element):
@@ -18,20 +19,25 @@ def get_element_text(element):
     text: str
         The inner text of the element.
     """
-    parts = [text.strip() for text in element.itertext()]
-    text = ''.join([p for p in parts if len(p) > 0])
-    return text.strip()
+    # The parts are stripped, so joining the non-empty ones in a single pass
+    # yields text without leading or trailing whitespace.
+    return ''.join(filter(None, (text.strip() for text in element.itertext())))
 
 
 class SessionUrlsCrawler:
     """Crawl session URLs for a specific year."""
 
-    SessionUrlRegex = r"\/pls\/steno\/steno2015.data\?cam=2&dat=(?P<date>\d{8})&idl=1"
+    SessionPathPrefix = "/pls/steno/steno2015.data?cam=2&dat="
+    SessionPathSuffix = "&idl=1"
+    # The hrefs are returned as plain strings since the crawler never needs
+    # the elements they belong to.
+    SessionHrefXPath = etree.XPath(
+        "//a[contains(@href, '/pls/steno/steno2015.data?cam=2&dat=')]/@href",
+        smart_strings=False)
 
     def __init__(self):
         """Create a new instance of session URLs crawler."""
-        self.__url_builder = UrlBuilder()
-        self.__browser = Browser()
+        self.__browser = get_browser()
 
     def crawl(self, year):
         """Crawl session URLs.
@@ -43,21 +49,58 @@ class SessionUrlsCrawler:
 
         Returns
         -------
-        dates_and_urls: iterable of tuples of (datetime, str)
+        dates_and_urls: iterable of tuples of (datetime.date, str)
             The collection of session dates and their URLS for the specified year.
         """
-        url = self.__url_builder.build_URL_for_year(year)
-        html_root = self.__browser.load_page(url)
+        url = UrlBuilder.build_URL_for_year(year)
+        # The calendar of a year doesn't change after the year ends, so a copy
+        # cached after that never expires from the page cache.
+        year_end = datetime.datetime(year + 1, 1, 1)
+        html_root = self.__browser.load_page(url, final_since=year_end)
+        # Let lxml select only the anchors pointing to session pages so that
+        # only a handful of hrefs are parsed instead of every anchor.
+        hrefs = SessionUrlsCrawler.SessionHrefXPath(html_root)
+        if len(hrefs) == 0:
+            logging.warning("The calendar for year %s contains no sessions.",
+                            year)
+            # The page may be an error page; don't keep it in the page cache
+            # where it would never expire.
+            page_cache = self.__browser.page_cache
+            if page_cache is not None:
+                page_cache.remove(url)
         result = []
-        for a in html_root.iterdescendants(tag='a'):
-            href = a.get('href')
-            if href is None:
-                continue
-            match = re.search(SessionUrlsCrawler.SessionUrlRegex, href,
-                              re.MULTILINE)
-            if match:
-                date_str = match.group('date')
-                session_date = datetime.datetime.strptime(date_str, "%Y%m%d")
-                session_url = self.__url_builder.build_full_URL(href)
+        for href in hrefs:
+            session_date = self.__parse_session_date(href)
+            if session_date is not None:
+                session_url = UrlBuilder.build_full_URL(href)
                 result.append((session_date, session_url))
         return result
+
+    def __parse_session_date(self, href):
+        """Parse the session date from the link to a session page.
+
+        Parameters
+        ----------
+        href: str, required
+            The link to the session page.
+
+        Returns
+        -------
+        session_date: datetime.date
+            The date of the session if the link has the expected format;
+            otherwise None.
+        """
+        # The links follow a fixed template with the date as YYYYMMDD, so the
+        # date is sliced directly instead of matching a regex and strptime.
+        start = href.find(SessionUrlsCrawler.SessionPathPrefix)
+        if start < 0:
+            return None
+        start = start + len(SessionUrlsCrawler.SessionPathPrefix)
+        end = start + 8
+        date_str = href[start:end]
+        if len(date_str) != 8 or not date_str.isdigit():
+            return None
+        if not href.startswith(SessionUrlsCrawler.SessionPathSuffix, end):
+            return None
+        return datetime.date(int(date_str[:4]), int(date_str[4:6]),
+                             int(date_str[6:]))
@@ -1,6 +1,15 @@
 """Modules required for navigation."""
+import atexit
+import datetime
+import functools
+import hashlib
 import logging
+import os
+import threading
+import time
+from pathlib import Path
 from lxml import html
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver import Firefox
 from selenium.webdriver.firefox.options import Options
 
@@ -12,11 +21,8 @@ class UrlBuilder:
     YearUrlTemplate = "/pls/steno/steno2015.calendar?cam=2&an={year}&idl=1"
     SessionUrlTemplate = "/pls/steno/steno2015.data?cam=2&dat={date}&idl=1"
 
-    def __init__(self):
-        """Create a new instance of the class."""
-        pass
-
-    def build_full_URL(self, path_and_query):
+    @staticmethod
+    def build_full_URL(path_and_query):
         """Build a full URL by appending base URL to path and query.
 
         Parameters
@@ -27,11 +33,15 @@ class UrlBuilder:
         Returns
         -------
         URL: str,
-            The full URL.
+            The full URL; if the provided value is already a full URL it is
+            returned unchanged.
         """
+        if path_and_query.startswith(('http://', 'https://')):
+            return path_and_query
         return UrlBuilder.BaseUrl + path_and_query
 
-    def build_URL_for_year(self, year):
+    @staticmethod
+    def build_URL_for_year(year):
         """Build URL for retrieving the calendar of sessions.
 
         Parameters
@@ -45,9 +55,10 @@ class UrlBuilder:
             The URL of the page containing the calendar of sessions for the specified year.
         """
         path_and_query = UrlBuilder.YearUrlTemplate.format(year=year)
-        return self.build_full_URL(path_and_query)
+        return UrlBuilder.build_full_URL(path_and_query)
 
-    def build_URL_for_session(self, session_date):
+    @staticmethod
+    def build_URL_for_session(session_date):
         """Build URL for a session that took place on the specified date.
 
         Parameters
@@ -62,33 +73,265 @@ class UrlBuilder:
         """
         date_string = session_date.strftime("%Y%m%d")
         path_and_query = UrlBuilder.SessionUrlTemplate.format(date=date_string)
-        return self.build_full_URL(path_and_query)
+        return UrlBuilder.build_full_URL(path_and_query)
+
+
+class PageCache:
+    """Store the source of loaded pages on disk."""
+
+    def __init__(self, cache_dir, max_age=datetime.timedelta(days=7)):
+        """Create a new instance of the class.
+
+        Parameters
+        ----------
+        cache_dir: str, required
+            The directory where to store the page sources.
+        max_age: datetime.timedelta, optional
+            The age after which a cached page is loaded again;
+            if None the cached pages never expire.
+        """
+        self.__cache_dir = Path(cache_dir)
+        self.__max_age = max_age
+
+    def load(self, url, final_since=None):
+        """Load the source of the page from cache.
+
+        Parameters
+        ----------
+        url: str, required
+            The URL of the page.
+        final_since: datetime.datetime, optional
+            The moment after which the page no longer changes; a copy cached
+            at or after this moment is loaded regardless of its age.
+
+        Returns
+        -------
+        page_source: str
+            The source of the page if it is cached and not expired;
+            None otherwise.
+        """
+        file_name = self.__get_file_name(url)
+        try:
+            cached_at = file_name.stat().st_mtime
+            is_final = (final_since is not None
+                        and cached_at >= final_since.timestamp())
+            if not is_final and self.__max_age is not None:
+                age = time.time() - cached_at
+                if age > self.__max_age.total_seconds():
+                    return None
+            return file_name.read_text(encoding='utf8')
+        except FileNotFoundError:
+            return None
+
+    def save(self, url, page_source):
+        """Save the source of the page to cache.
+
+        Parameters
+        ----------
+        url: str, required
+            The URL of the page.
+        page_source: str, required
+            The source of the page.
+        """
+        file_name = self.__get_file_name(url)
+        file_name.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so that other threads never read
+        # a partially written page.
+        tmp_file = file_name.with_name("{}.{}.tmp".format(
+            file_name.name, threading.get_ident()))
+        tmp_file.write_text(page_source, encoding='utf8')
+        os.replace(tmp_file, file_name)
+
+    def remove(self, url):
+        """Remove the source of the page from cache if present.
+
+        Parameters
+        ----------
+        url: str, required
+            The URL of the page.
+        """
+        self.__get_file_name(url).unlink(missing_ok=True)
+
+    def __get_file_name(self, url):
+        """Build the path of the file storing the page source.
+
+        Parameters
+        ----------
+        url: str, required
+            The URL of the page.
+
+        Returns
+        -------
+        file_name: pathlib.Path
+            The path of the cache file.
+        """
+        key = hashlib.sha1(url.encode('utf8')).hexdigest()
+        return self.__cache_dir / "{}.html".format(key)
 
 
 class Browser:
-    """Load page markup from the URLs."""
+    """Load page markup from the URLs.
+
+    Starting a web browser is by far the most expensive part of loading a
+    page, so the browser instances are kept alive and reused by all
+    `Browser` objects. Each thread gets its own web browser because a
+    WebDriver cannot be driven from multiple threads at the same time.
+    """
+
+    __drivers = {}
+    __drivers_lock = threading.Lock()
+    __parsers = threading.local()
 
     def __init__(self):
         """Create a new instance of the class."""
         self.__browser_options = Options()
         self.__browser_options.add_argument('-headless')
+        self.__page_cache = None
 
-    def load_page(self, url):
+    @property
+    def page_cache(self):
+        """Get or set the on-disk cache of page sources.
+
+        When set, the pages are loaded from the cache if possible and the
+        downloaded pages are saved into it; None disables the cache.
+        """
+        return self.__page_cache
+
+    @page_cache.setter
+    def page_cache(self, value):
+        self.__page_cache = value
+
+    def load_page(self, url, final_since=None):
         """Request the page for the specified URL and returns the HTML markup.
 
         Parameters
         ----------
         url: str, required
             The URL of the page to load.
+        final_since: datetime.datetime, optional
+            The moment after which the page no longer changes; a copy saved
+            in the on-disk cache at or after this moment never expires.
 
         Returns
         -------
         html: etree.Element
             The HTML of the page parsed into a tree structure.
         """
+        page_cache = self.__page_cache
+        page_source = None
+        if page_cache is not None:
+            page_source = page_cache.load(url, final_since)
+            if page_source is not None:
+                logging.debug("Loaded {} from cache.".format(url))
+        if page_source is None:
+            page_source = self.__download_page(url)
+            if page_cache is not None:
+                page_cache.save(url, page_source)
+        return html.fromstring(page_source, parser=Browser.__get_parser())
+
+    def __download_page(self, url):
+        """Download the page from the specified URL using the web browser.
+
+        Parameters
+        ----------
+        url: str, required
+            The URL of the page to download.
+
+        Returns
+        -------
+        page_source: str
+            The source of the page.
+        """
         logging.info("Navigating to {}.".format(url))
-        browser = Firefox(options=self.__browser_options)
-        browser.get(url)
-        page_source = browser.page_source
-        browser.quit()
-        return html.fromstring(page_source)
+        browser = self.__get_driver()
+        try:
+            browser.get(url)
+            return browser.page_source
+        except WebDriverException:
+            # The browser may be in an unusable state; start a new one on
+            # the next request instead of failing all subsequent requests.
+            Browser.__discard_driver()
+            raise
+
+    @classmethod
+    def quit(cls):
+        """Shut down all web browsers started for loading pages."""
+        with cls.__drivers_lock:
+            drivers = list(cls.__drivers.values())
+            cls.__drivers.clear()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except WebDriverException as e:
+                logging.warning("Could not shut down web browser.", exc_info=e)
+
+    def __get_driver(self):
+        """Get the web browser of the current thread, starting it if needed.
+
+        Returns
+        -------
+        driver: selenium.webdriver.Firefox
+            The web browser used by the current thread.
+        """
+        thread_id = threading.get_ident()
+        with Browser.__drivers_lock:
+            driver = Browser.__drivers.get(thread_id)
+        if driver is None:
+            logging.debug("Starting web browser for thread %s.", thread_id)
+            driver = Firefox(options=self.__browser_options)
+            with Browser.__drivers_lock:
+                Browser.__drivers[thread_id] = driver
+        return driver
+
+    @classmethod
+    def __get_parser(cls):
+        """Get the HTML parser of the current thread.
+
+        The parser does not build the index of element ids, which is never
+        used by the crawlers, drops the processing instructions from the tree,
+        and accepts the very large transcript pages. Comments are kept since
+        removing them merges the text around them into the `.text` of the
+        parent element, which the summary parsers read.
+
+        Returns
+        -------
+        parser: lxml.html.HTMLParser
+            The HTML parser of the current thread.
+        """
+        parser = getattr(cls.__parsers, 'parser', None)
+        if parser is None:
+            parser = html.HTMLParser(collect_ids=False,
+                                     remove_pis=True,
+                                     huge_tree=True)
+            cls.__parsers.parser = parser
+        return parser
+
+    @classmethod
+    def __discard_driver(cls):
+        """Shut down the web browser of the current thread."""
+        with cls.__drivers_lock:
+            driver = cls.__drivers.pop(threading.get_ident(), None)
+        if driver is None:
+            return
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            logging.warning("Could not shut down web browser.", exc_info=e)
+
+
+atexit.register(Browser.quit)
+
+
+@functools.lru_cache(maxsize=1)
+def get_browser():
+    """Get the browser shared by all crawlers.
+
+    Sharing the browser makes all crawlers use the same page cache and the
+    same web browser instances.
+
+    Returns
+    -------
+    browser: Browser
+        The shared instance of the browser.
+    """
+    return Browser()
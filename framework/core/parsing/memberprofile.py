@@ -1,11 +1,16 @@
 """Module responsible for parsing MP profile info from page."""
 from lxml.etree import Element
+from lxml.cssselect import CSSSelector
 from typing import Tuple, Iterable
 
 
 class MemberProfileInfoParser:
     """Parse the profile info of Members of Parliament."""
 
+    ProfileImageSelector = CSSSelector('div.profile-pic-dep a',
+                                       translator='html')
+    FullNameSelector = CSSSelector('div.boxTitle h1', translator='html')
+
     def parse_profile_info(self, html: Element) -> dict:
         """Parse the profile info from the provided HTML element.
 
@@ -42,7 +47,7 @@ class MemberProfileInfoParser:
         image_url: str
             The URL of the profile image if found; None otherwise.
         """
-        for a in html.cssselect('div.profile-pic-dep a'):
+        for a in MemberProfileInfoParser.ProfileImageSelector(html):
             return a.get('href')
 
         return None
@@ -60,7 +65,7 @@ class MemberProfileInfoParser:
         full_name: str
             The full name of the MP.
         """
-        for h1 in html.cssselect('div.boxTitle h1'):
+        for h1 in MemberProfileInfoParser.FullNameSelector(html):
             return h1.text_content()
 
         return None
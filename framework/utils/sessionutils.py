@@ -1,12 +1,15 @@
 #!/usr/bin/env python
 """Utility functions for session processing."""
 import logging
-import json
+import orjson
 from pathlib import Path
 
 
 def load_speakers(sessions_directory):
-    """Parse sessions in the specified directory and load all speakers.
+    """Parse sessions in the specified directory and iterate over all speakers.
+
+    The speakers are yielded as each session is parsed, so only one session
+    transcript is kept in memory at a time.
 
     Parameters
     ----------
@@ -15,28 +18,24 @@ def load_speakers(sessions_directory):
 
     Returns
     -------
-    speakers: list of dict
-        The list of all speakers from all sessions.
+    speakers: generator of dict
+        The speakers from all sessions.
     """
-    speakers = []
     for f in Path(sessions_directory).glob("*.json"):
         logging.info("Reading speakers from %s.", f)
-        with open(str(f), 'r', encoding='utf8') as input_file:
-            session = json.load(input_file)
-            if 'sections' not in session:
-                logging.error("Could not find session sections in %s.", f)
-                continue
-
-            for section in session['sections']:
-                speaker = section['speaker']
-                contents = section['contents']
-                if contents is None or len(contents) == 0:
-                    continue
-                if speaker is None:
-                    logging.warning("Found null speaker in section %s.",
-                                    section)
-                    continue
+        with open(str(f), 'rb') as input_file:
+            session = orjson.loads(input_file.read())
+        if 'sections' not in session:
+            logging.error("Could not find session sections in %s.", f)
+            continue
 
-                speakers.append(speaker)
+        for section in session['sections']:
+            speaker = section['speaker']
+            contents = section['contents']
+            if contents is None or len(contents) == 0:
+                continue
+            if speaker is None:
+                logging.warning("Found null speaker in section %s.", section)
+                continue
 
-    return speakers
+            yield speaker